@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import importlib
+from typing import Callable
+from PySide6.QtWidgets import QWidget
+from Common.Scene import Scene
+from Common.CanvasProtocol import CanvasProtocol
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Backend():
+	"""The registry entry of the rendering backend."""
+
+	def __init__(self, name: str, directory: str, interactive: bool, shareable: bool) -> None:
+		"""
+		Backend class initialization.
+
+		Attributes:
+			name(str): name of the backend used on the command line.
+			directory(str): directory of the backend program with the Source package.
+			interactive(bool): the backend handles large scenes interactively.
+			shareable(bool): the backend produces the shareable html file.
+		"""
+		self.name = name
+		self.directory = directory
+		self.interactive = interactive
+		self.shareable = shareable
+
+	def load_window(self) -> type:
+		"""
+		Import and return the PlotWindow class of the backend.
+
+		Every backend ships its own Source package, so only one backend can be loaded by the process.
+		"""
+		path = os.path.join(ROOT_DIR, self.directory)
+		if path not in sys.path:
+			sys.path.insert(0, path)
+
+		return importlib.import_module('Source.PlotWindow').PlotWindow
+
+	def create_window(self, scene: Scene) -> QWidget:
+		"""Create the PlotWindow of the backend and check that its canvas implements CanvasProtocol."""
+		window = self.load_window()(scene)
+		if not isinstance(window.chart, CanvasProtocol):
+			raise TypeError(f"Canvas of the backend '{self.name}' does not implement CanvasProtocol")
+
+		return window
+
+BACKENDS = {}
+
+def register_backend(backend: Backend) -> None:
+	"""Add the backend to the registry."""
+	BACKENDS[backend.name] = backend
+
+def get_backend(name: str) -> Backend:
+	"""Return the registered backend by name."""
+	if name not in BACKENDS:
+		raise KeyError(f"Unknown backend '{name}', available: {', '.join(BACKENDS)}")
+
+	return BACKENDS[name]
+
+def find_backend(predicate: Callable[[Backend], bool]) -> Backend:
+	"""Return the first registered backend matching the predicate."""
+	for backend in BACKENDS.values():
+		if predicate(backend):
+			return backend
+
+	raise KeyError("No registered backend matches the scene requirements")
+
+def select_backend(scene: Scene, thresholds: dict, share: bool = False) -> Backend:
+	"""
+	Choose the backend by the scene complexity.
+
+	Shareable backends are used only when requested, static backends draw scenes below
+	the calibrated threshold and interactive backends draw the larger scenes.
+
+	Attributes:
+		scene(Scene): the scene to draw.
+		thresholds(dict): the host thresholds from Common.Benchmark.load_thresholds.
+		share(bool): the scene should be saved as shareable html.
+	"""
+	if share:
+		return find_backend(lambda backend: backend.shareable)
+
+	if scene.triangle_count <= thresholds['matplotlib_max_triangles']:
+		return find_backend(lambda backend: not backend.interactive and not backend.shareable)
+
+	return find_backend(lambda backend: backend.interactive and not backend.shareable)
+
+register_backend(Backend('matplotlib', 'matlablib', interactive=False, shareable=False))
+register_backend(Backend('pyvista', 'pyvista', interactive=True, shareable=False))
+register_backend(Backend('plotly', 'plotly', interactive=True, shareable=True))
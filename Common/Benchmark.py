@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import platform
+import numpy as np
+from Common.Scene import Scene
+
+CALIBRATION_FILE = os.path.join(os.path.expanduser('~'), '.cache', '3dSimpleFigures', 'calibration.json')
+DEFAULT_THRESHOLDS = {'matplotlib_max_triangles': 2000}
+FRAME_BUDGET = 1 / 15
+BENCHMARK_RESOLUTIONS = (4, 16, 32)
+
+def measure_matplotlib_frame(scene: Scene, repeats: int = 3) -> float:
+	"""Return the best time in seconds of the offscreen matplotlib redraw of the scene."""
+	from matplotlib.figure import Figure
+	from matplotlib.backends.backend_agg import FigureCanvasAgg
+	from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+	figure = Figure(figsize=(5, 5), dpi=100)
+	canvas = FigureCanvasAgg(figure)
+	axis = figure.add_subplot(111, projection='3d')
+	axis.set_axis_off()
+
+	for electrode in scene.electrodes:
+		axis.add_collection3d(Poly3DCollection(electrode.triangles(), facecolor=electrode.color, edgecolor='k', alpha=electrode.opacity))
+
+	canvas.draw()
+	best = float('inf')
+	for _ in range(repeats):
+		axis.view_init(elev=30, azim=axis.azim + 5)
+		start = time.perf_counter()
+		canvas.draw()
+		best = min(best, time.perf_counter() - start)
+
+	return best
+
+def calibrate(frame_budget: float = FRAME_BUDGET) -> dict:
+	"""
+	Run the micro-benchmark and calculate the backend thresholds of the host.
+
+	The matplotlib redraw time is fitted linearly over the triangle count and
+	the threshold is the largest scene which is still redrawn within the frame budget.
+	"""
+	counts = []
+	timings = []
+	for resolution in BENCHMARK_RESOLUTIONS:
+		scene = Scene.capacitor(resolution=resolution)
+		counts.append(scene.triangle_count)
+		timings.append(measure_matplotlib_frame(scene))
+
+	per_triangle, overhead = np.polyfit(counts, timings, 1)
+	if per_triangle <= 0:
+		max_triangles = counts[-1]
+	else:
+		max_triangles = int(max(0, (frame_budget - overhead) / per_triangle))
+
+	return {'matplotlib_max_triangles': max_triangles}
+
+def load_thresholds(recalibrate: bool = False, file_path: str = CALIBRATION_FILE) -> dict:
+	"""
+	Return the thresholds of the host, running the calibration when they are not cached.
+
+	The corrupt or half-written cache file is treated as empty and replaced atomically.
+	"""
+	host = platform.node()
+	cache = {}
+
+	if os.path.exists(file_path):
+		try:
+			with open(file_path, "r", encoding="utf-8") as f:
+				cache = json.load(f)
+		except (OSError, ValueError):
+			cache = {}
+		if not isinstance(cache, dict):
+			cache = {}
+
+	if isinstance(cache.get(host), dict) and not recalibrate:
+		return {**DEFAULT_THRESHOLDS, **cache[host]}
+
+	try:
+		thresholds = calibrate()
+	except ImportError:
+		return dict(DEFAULT_THRESHOLDS)
+
+	cache[host] = thresholds
+	os.makedirs(os.path.dirname(file_path), exist_ok=True)
+	temporary_path = file_path + '.tmp'
+	with open(temporary_path, "w", encoding="utf-8") as f:
+		json.dump(cache, f, indent=4)
+	os.replace(temporary_path, file_path)
+
+	return {**DEFAULT_THRESHOLDS, **thresholds}
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Protocol, runtime_checkable
+from Common.Scene import Scene
+
+@runtime_checkable
+class CanvasProtocol(Protocol):
+	"""The interface every backend canvas implements."""
+
+	def draw_scene(self, scene: Scene) -> None:
+		"""Draw the whole scene replacing the previous contents."""
+		...
+
+	def draw_arrow_axis(self, arrow_length: float = 0.1, enable_axis: bool = True) -> None:
+		"""
+		Replace the current axis arrows, with enable_axis=False only remove them.
+
+		Calling it repeatedly never duplicates the arrows, so windows can toggle
+		the axis without redrawing the whole scene.
+		"""
+		...
+
+	def clear_plot(self) -> None:
+		"""Remove all drawn objects."""
+		...
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import json
+import zlib
+import struct
+import numpy as np
+from typing import Callable, Iterator
+from Common.Scene import Scene, AXIS_RGB
+
+CHUNK_SIZE = 1 << 20
+
+GLB_MAGIC = 0x46546C67
+GLB_JSON_CHUNK = 0x4E4F534A
+GLB_BIN_CHUNK = 0x004E4942
+GL_FLOAT = 5126
+GL_UNSIGNED_INT = 5125
+GL_LINES = 1
+GL_TRIANGLES = 4
+
+class Blob():
+	"""The binary array written to the file in chunks without copying the source data."""
+
+	def __init__(self, nbytes: int, chunks: Callable[[], Iterator]) -> None:
+		"""
+		Blob class initialization.
+
+		Attributes:
+			nbytes(int): size of the whole array in bytes.
+			chunks(Callable): function returning an iterator over the array parts.
+		"""
+		self.nbytes = nbytes
+		self.chunks = chunks
+
+	@classmethod
+	def from_array(cls, array: np.ndarray, dtype: str, chunk_size: int = CHUNK_SIZE) -> 'Blob':
+		"""Create the blob from the array, the array is converted only if its dtype or order differs."""
+		array = np.ascontiguousarray(array, dtype=dtype).reshape(-1)
+		return cls(array.nbytes, lambda: array_chunks(array, chunk_size))
+
+def array_chunks(array: np.ndarray, chunk_size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+	"""Yield the views of the array bytes, at most chunk_size bytes long."""
+	view = memoryview(array).cast('B')
+	for start in range(0, len(view), chunk_size):
+		yield view[start:start + chunk_size]
+
+def fixed_blocks(chunks: Iterator, block_size: int) -> Iterator[memoryview]:
+	"""Regroup the chunks into blocks of block_size bytes, the last block may be shorter."""
+	buffer = bytearray()
+	for chunk in chunks:
+		view = memoryview(chunk).cast('B')
+		while len(view):
+			if not buffer and len(view) >= block_size:
+				yield view[:block_size]
+				view = view[block_size:]
+				continue
+
+			taken = min(block_size - len(buffer), len(view))
+			buffer += view[:taken]
+			view = view[taken:]
+			if len(buffer) == block_size:
+				yield memoryview(bytes(buffer))
+				buffer.clear()
+
+	if buffer:
+		yield memoryview(bytes(buffer))
+
+def padding(nbytes: int, alignment: int = 4) -> int:
+	"""Return the number of bytes aligning nbytes to the alignment."""
+	return -nbytes % alignment
+
+def write_blob(file, blob: Blob) -> None:
+	"""Write all chunks of the blob to the file."""
+	for chunk in blob.chunks():
+		file.write(chunk)
+
+def axis_lines(scene: Scene) -> tuple[np.ndarray, np.ndarray]:
+	"""Return the vertices and rgb colors of the axis arrows drawn as lines."""
+	vertices = np.zeros((6, 3), dtype=np.float32)
+	for i in range(3):
+		vertices[2 * i + 1, i] = scene.arrow_length
+
+	return vertices, np.array(AXIS_RGB, dtype=np.float32)
+
+def export_glb(scene: Scene, file_path: str, chunk_size: int = CHUNK_SIZE) -> None:
+	"""
+	Save the scene as binary glTF file.
+
+	The electrode arrays are streamed to the file in chunks, so the file size is
+	known before writing and no copy of the geometry is kept in memory. Core glTF
+	has no generic buffer compression, so the arrays are always written raw, and
+	electrodes without triangles are skipped.
+
+	Attributes:
+		scene(Scene): the scene to save.
+		file_path(str): path of the glb file.
+		chunk_size(int): size of written parts in bytes.
+	"""
+	gltf = {
+		'asset': {'version': '2.0', 'generator': '3dSimpleFigures'},
+		'scene': 0,
+		'scenes': [{'nodes': []}],
+		'nodes': [],
+		'meshes': [],
+		'materials': [],
+		'accessors': [],
+		'bufferViews': [],
+		'buffers': []}
+	blobs = []
+	offset = 0
+
+	def add_accessor(blob: Blob, component_type: int, count: int, accessor_type: str, **extra) -> int:
+		"""Append the blob as the buffer view with the accessor and return the accessor index."""
+		nonlocal offset
+		gltf['bufferViews'].append({'buffer': 0, 'byteOffset': offset, 'byteLength': blob.nbytes})
+		gltf['accessors'].append({
+			'bufferView': len(gltf['bufferViews']) - 1,
+			'componentType': component_type,
+			'count': count,
+			'type': accessor_type,
+			**extra})
+		blobs.append(blob)
+		offset += blob.nbytes + padding(blob.nbytes)
+		return len(gltf['accessors']) - 1
+
+	def add_mesh(name: str, primitives: list) -> None:
+		"""Append the mesh with the node referencing it."""
+		gltf['meshes'].append({'name': name, 'primitives': primitives})
+		gltf['nodes'].append({'name': name, 'mesh': len(gltf['meshes']) - 1})
+		gltf['scenes'][0]['nodes'].append(len(gltf['nodes']) - 1)
+
+	for electrode in scene.electrodes:
+		if not electrode.triangle_count:
+			continue
+
+		gltf['materials'].append({
+			'name': electrode.name,
+			'pbrMetallicRoughness': {'baseColorFactor': [*electrode.color, electrode.opacity], 'metallicFactor': 0.0},
+			'alphaMode': 'BLEND',
+			'doubleSided': True})
+		position = add_accessor(
+			Blob.from_array(electrode.vertices, '<f4', chunk_size), GL_FLOAT, len(electrode.vertices), 'VEC3',
+			min=electrode.vertices.min(axis=0).tolist(), max=electrode.vertices.max(axis=0).tolist())
+		indices = add_accessor(Blob.from_array(electrode.faces, '<u4', chunk_size), GL_UNSIGNED_INT, electrode.faces.size, 'SCALAR')
+		add_mesh(electrode.name, [{
+			'attributes': {'POSITION': position},
+			'indices': indices,
+			'material': len(gltf['materials']) - 1,
+			'mode': GL_TRIANGLES}])
+
+	if scene.show_axis:
+		vertices, colors = axis_lines(scene)
+		primitives = []
+		for i, color in enumerate(colors):
+			line = vertices[2 * i:2 * i + 2]
+			gltf['materials'].append({'pbrMetallicRoughness': {'baseColorFactor': [*color.tolist(), 1.0]}})
+			position = add_accessor(
+				Blob.from_array(line, '<f4'), GL_FLOAT, 2, 'VEC3',
+				min=line.min(axis=0).tolist(), max=line.max(axis=0).tolist())
+			primitives.append({'attributes': {'POSITION': position}, 'material': len(gltf['materials']) - 1, 'mode': GL_LINES})
+		add_mesh("Axis", primitives)
+
+	gltf['buffers'].append({'byteLength': offset})
+	header = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+	header += b' ' * padding(len(header))
+	total_length = 12 + 8 + len(header) + 8 + offset
+
+	with open(file_path, "wb") as f:
+		f.write(struct.pack('<III', GLB_MAGIC, 2, total_length))
+		f.write(struct.pack('<II', len(header), GLB_JSON_CHUNK))
+		f.write(header)
+		f.write(struct.pack('<II', offset, GLB_BIN_CHUNK))
+		for blob in blobs:
+			write_blob(f, blob)
+			f.write(b'\0' * padding(blob.nbytes))
+
+def cell_offsets(count: int, size: int, chunk_size: int = CHUNK_SIZE) -> Blob:
+	"""Return the VTK offsets of count cells with size points each, generated chunk by chunk."""
+	step = max(1, chunk_size // 4)
+
+	def chunks() -> Iterator:
+		for start in range(0, count, step):
+			stop = min(start + step, count)
+			yield np.arange(start + 1, stop + 1, dtype='<u4') * np.uint32(size)
+
+	return Blob(count * 4, chunks)
+
+def cell_colors(count: int, color: tuple, opacity: float, chunk_size: int = CHUNK_SIZE) -> Blob:
+	"""Return the RGBA UInt8 colors of count cells, generated chunk by chunk."""
+	rgba = np.array([round(c * 255) for c in (*color, opacity)], dtype=np.uint8)
+	step = max(1, chunk_size // 4)
+	block = np.tile(rgba, step)
+
+	def chunks() -> Iterator:
+		for start in range(0, count, step):
+			yield block[:4 * (min(start + step, count) - start)]
+
+	return Blob(count * 4, chunks)
+
+class VTPWriter():
+	"""The streaming writer of VTK XML PolyData files with the appended binary data."""
+
+	def __init__(self, file_path: str, compress: bool = True, block_size: int = CHUNK_SIZE, level: int = 1) -> None:
+		"""
+		VTPWriter class initialization.
+
+		Attributes:
+			file_path(str): path of the vtp file.
+			compress(bool): compress the arrays with zlib.
+			block_size(int): size of compressed blocks in bytes.
+			level(int): zlib compression level.
+		"""
+		self.file_path = file_path
+		self.compress = compress
+		self.block_size = block_size
+		self.level = level
+		self.pieces = []
+		self.blobs = []
+
+	def data_array(self, blob: Blob, vtk_type: str, name: str, components: int = 1) -> str:
+		"""Register the blob and return its DataArray element with the offset placeholder."""
+		self.blobs.append(blob)
+		return (f'<DataArray type="{vtk_type}" Name="{name}" NumberOfComponents="{components}" '
+			f'format="appended" offset="{{offset{len(self.blobs) - 1}:020d}}"/>')
+
+	def add_piece(self, name: str, points: Blob, point_count: int, cells: Blob, offsets: Blob, colors: Blob, cell_count: int, cell_type: str) -> None:
+		"""
+		Add the piece with one kind of cells.
+
+		Attributes:
+			name(str): name of the piece stored in the comment, double hyphens are split by spaces.
+			points(Blob): Float32 point positions.
+			point_count(int): number of points.
+			cells(Blob): UInt32 connectivity of cells.
+			offsets(Blob): UInt32 end offsets of cells.
+			colors(Blob): UInt8 RGBA colors of cells.
+			cell_count(int): number of cells.
+			cell_type(str): 'Lines' or 'Polys'.
+		"""
+		counts = {'Verts': 0, 'Lines': 0, 'Strips': 0, 'Polys': 0}
+		counts[cell_type] = cell_count
+		attributes = ' '.join(f'NumberOf{key}="{value}"' for key, value in counts.items())
+		comment = re.sub('-(?=-)', '- ', name).replace('{', '{{').replace('}', '}}')
+
+		self.pieces.append('\n'.join([
+			f'<!-- {comment} -->',
+			f'<Piece NumberOfPoints="{point_count}" {attributes}>',
+			'<CellData Scalars="Color">',
+			self.data_array(colors, 'UInt8', 'Color', 4),
+			'</CellData>',
+			'<Points>',
+			self.data_array(points, 'Float32', 'Points', 3),
+			'</Points>',
+			f'<{cell_type}>',
+			self.data_array(cells, 'UInt32', 'connectivity'),
+			self.data_array(offsets, 'UInt32', 'offsets'),
+			f'</{cell_type}>',
+			'</Piece>']))
+
+	def write(self) -> None:
+		"""Write the header and stream all registered arrays to the file."""
+		compressor = ' compressor="vtkZLibDataCompressor"' if self.compress else ''
+		template = '\n'.join([
+			'<?xml version="1.0"?>',
+			f'<VTKFile type="PolyData" version="1.0" byte_order="LittleEndian" header_type="UInt64"{compressor}>',
+			'<PolyData>',
+			*self.pieces,
+			'</PolyData>',
+			'<AppendedData encoding="raw">',
+			'_'])
+		placeholders = {f'offset{i}': 0 for i in range(len(self.blobs))}
+
+		with open(self.file_path, "wb") as f:
+			f.write(template.format(**placeholders).encode('utf-8'))
+			start = f.tell()
+
+			for i, blob in enumerate(self.blobs):
+				placeholders[f'offset{i}'] = f.tell() - start
+				if self.compress:
+					self.write_compressed(f, blob)
+				else:
+					f.write(struct.pack('<Q', blob.nbytes))
+					write_blob(f, blob)
+
+			f.write(b'\n</AppendedData>\n</VTKFile>\n')
+			f.seek(0)
+			f.write(template.format(**placeholders).encode('utf-8'))
+
+	def write_compressed(self, file, blob: Blob) -> None:
+		"""Write the blob as zlib compressed blocks, the block sizes are filled in after writing."""
+		block_count = -(-blob.nbytes // self.block_size)
+		header_position = file.tell()
+		file.write(b'\0' * 8 * (3 + block_count))
+
+		sizes = []
+		for block in fixed_blocks(blob.chunks(), self.block_size):
+			compressed = zlib.compress(block, self.level)
+			sizes.append(len(compressed))
+			file.write(compressed)
+
+		end_position = file.tell()
+		file.seek(header_position)
+		file.write(struct.pack(f'<{3 + block_count}Q', block_count, self.block_size, blob.nbytes % self.block_size, *sizes))
+		file.seek(end_position)
+
+def export_vtp(scene: Scene, file_path: str, compress: bool = True, chunk_size: int = CHUNK_SIZE) -> None:
+	"""
+	Save the scene as VTK XML PolyData file with one piece per electrode.
+
+	Attributes:
+		scene(Scene): the scene to save.
+		file_path(str): path of the vtp file.
+		compress(bool): compress the arrays with zlib.
+		chunk_size(int): size of written parts and compressed blocks in bytes.
+	"""
+	writer = VTPWriter(file_path, compress, chunk_size)
+
+	for electrode in scene.electrodes:
+		count = electrode.triangle_count
+		writer.add_piece(
+			electrode.name,
+			Blob.from_array(electrode.vertices, '<f4', chunk_size), len(electrode.vertices),
+			Blob.from_array(electrode.faces, '<u4', chunk_size),
+			cell_offsets(count, 3, chunk_size),
+			cell_colors(count, electrode.color, electrode.opacity, chunk_size),
+			count, 'Polys')
+
+	if scene.show_axis:
+		vertices, colors = axis_lines(scene)
+		rgba = np.column_stack((np.round(colors * 255), np.full(3, 255))).astype(np.uint8)
+		writer.add_piece(
+			"Axis",
+			Blob.from_array(vertices, '<f4'), len(vertices),
+			Blob.from_array(np.arange(6), '<u4'),
+			cell_offsets(3, 2),
+			Blob.from_array(rgba, 'u1'),
+			3, 'Lines')
+
+	writer.write()
+
+EXPORTERS = {
+	'.glb': lambda scene, file_path, compress: export_glb(scene, file_path),
+	'.vtp': export_vtp}
+
+def export_scene(scene: Scene, file_path: str, compress: bool = True) -> None:
+	"""Save the scene in the format chosen by the file extension, compress applies to the vtp files only."""
+	extension = os.path.splitext(file_path)[1].lower()
+	if extension not in EXPORTERS:
+		raise ValueError(f"Unsupported export format '{extension}', available: {', '.join(EXPORTERS)}")
+
+	EXPORTERS[extension](scene, file_path, compress)
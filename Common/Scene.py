@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+AXIS_COLORS = ('red', 'green', 'blue')
+AXIS_RGB = ((1.0, 0.0, 0.0), (0.0, 0.5, 0.0), (0.0, 0.0, 1.0))
+
+class Electrode():
+	"""The triangulated electrode shared by all backends."""
+
+	def __init__(self, name: str, vertices: np.ndarray, faces: np.ndarray, color: tuple, opacity: float = 0.5) -> None:
+		"""
+		Electrode class initialization.
+
+		Attributes:
+			name(str): name of the electrode shown in legends.
+			vertices(np.ndarray): (N, 3) float array with vertex positions.
+			faces(np.ndarray): (M, 3) int array with vertex indices of triangles.
+			color(tuple): RGB color with components in range 0..1.
+			opacity(float): opacity of the electrode surface.
+		"""
+		self.name = name
+		self.vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+		self.faces = np.ascontiguousarray(faces, dtype=np.uint32)
+		self.color = tuple(color)
+		self.opacity = opacity
+		self.previews = {}
+
+	@property
+	def triangle_count(self) -> int:
+		"""Return the number of triangles of the electrode."""
+		return len(self.faces)
+
+	def triangles(self) -> np.ndarray:
+		"""Return (M, 3, 3) array with vertex positions of every triangle."""
+		return self.vertices[self.faces]
+
+	def decimate(self, max_triangles: int) -> 'Electrode':
+		"""
+		Return the simplified copy of the electrode with at most max_triangles triangles.
+
+		The vertices are clustered by the grid of cubic cells, so every axis gets the number of
+		cells matching its extent and thin electrodes keep their width. The cells grow until the
+		remaining non-degenerate triangles fit; when the budget cannot be met without losing all
+		triangles, the last non-empty level is used, or the electrode itself if every level is empty. Clusters touching
+		the bounding box are snapped to it to keep the outline, and the result is cached.
+		"""
+		if self.triangle_count <= max_triangles:
+			return self
+
+		if max_triangles in self.previews:
+			return self.previews[max_triangles]
+
+		bottom = self.vertices.min(axis=0)
+		top = self.vertices.max(axis=0)
+		extent = np.sort(top - bottom)[::-1]
+		area = extent[0] * (extent[1] if extent[1] > 0 else extent[0])
+		cell = float(np.sqrt(area / max(1, max_triangles / 2))) or 1.0
+
+		level = self.cluster(bottom, top, cell)
+		for _ in range(64):
+			if len(level[1]):
+				break
+			cell /= np.sqrt(2)
+			level = self.cluster(bottom, top, cell)
+
+		if not len(level[1]):
+			self.previews[max_triangles] = self
+			return self
+
+		while len(level[1]) > max_triangles:
+			coarser = self.cluster(bottom, top, cell * np.sqrt(2))
+			if not len(coarser[1]):
+				break
+			level = coarser
+			cell *= np.sqrt(2)
+
+		inverse, faces = level
+		clusters = int(inverse.max()) + 1
+		counts = np.bincount(inverse, minlength=clusters)[:, None]
+		vertices = np.zeros((clusters, 3))
+		np.add.at(vertices, inverse, self.vertices)
+		vertices /= counts
+
+		lower = np.full((clusters, 3), np.inf)
+		upper = np.full((clusters, 3), -np.inf)
+		np.minimum.at(lower, inverse, self.vertices)
+		np.maximum.at(upper, inverse, self.vertices)
+		vertices = np.where(lower == bottom, bottom, vertices)
+		vertices = np.where(upper == top, top, vertices)
+
+		self.previews[max_triangles] = Electrode(self.name, vertices, faces, self.color, self.opacity)
+		return self.previews[max_triangles]
+
+	def cluster(self, bottom: np.ndarray, top: np.ndarray, cell: float) -> tuple[np.ndarray, np.ndarray]:
+		"""Return the cluster index of every vertex and the non-degenerate unique faces for the cell size."""
+		cells = np.maximum(1, np.ceil((top - bottom) / cell)).astype(np.int64)
+		keys = np.minimum(np.floor((self.vertices - bottom) / cell).astype(np.int64), cells - 1)
+		keys = (keys[:, 0] * cells[1] + keys[:, 1]) * cells[2] + keys[:, 2]
+		_, inverse = np.unique(keys, return_inverse=True)
+		inverse = inverse.reshape(-1)
+
+		faces = inverse[self.faces]
+		faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])]
+		return inverse, np.unique(faces, axis=0)
+
+	def rgba_string(self) -> str:
+		"""Return the color as css rgba string."""
+		r, g, b = (int(round(c * 255)) for c in self.color)
+		return f'rgba({r},{g},{b},{self.opacity})'
+
+class Scene():
+	"""The backend independent description of the drawn model."""
+
+	def __init__(self, electrodes: list[Electrode] | None = None, arrow_length: float = 0.1, show_axis: bool = True) -> None:
+		"""
+		Scene class initialization.
+
+		Attributes:
+			electrodes(list): list of electrodes to draw.
+			arrow_length(float): length of the axis arrows.
+			show_axis(bool): draw the axis arrows.
+		"""
+		self.electrodes = electrodes if electrodes is not None else []
+		self.arrow_length = arrow_length
+		self.show_axis = show_axis
+
+	@property
+	def triangle_count(self) -> int:
+		"""Return the number of triangles of the whole scene."""
+		return sum(electrode.triangle_count for electrode in self.electrodes)
+
+	@classmethod
+	def capacitor(cls, size: float = 1.0, electrode_distance: float = 0.2, resolution: int = 1) -> 'Scene':
+		"""
+		Create a scene with the model of the capacitor.
+
+		Attributes:
+			size(float): edge length of the square electrodes.
+			electrode_distance(float): distance between electrodes.
+			resolution(int): number of grid cells along the electrode edge.
+		"""
+		vertices, faces = plane_grid(size, resolution)
+		top_vertices = vertices.copy()
+		top_vertices[:, 2] += electrode_distance
+
+		return cls([
+			Electrode("Bottom electrode", vertices, faces, (0.96, 0.09, 0.39)),
+			Electrode("Top electrode", top_vertices, faces, (0.39, 0.09, 0.96))])
+
+def plane_grid(size: float, resolution: int) -> tuple[np.ndarray, np.ndarray]:
+	"""Triangulate the square plane z=0 with the regular grid."""
+	steps = np.linspace(0, size, resolution + 1)
+	x, y = np.meshgrid(steps, steps, indexing='ij')
+	vertices = np.column_stack((x.ravel(), y.ravel(), np.zeros(x.size)))
+
+	index = np.arange((resolution + 1) ** 2).reshape(resolution + 1, resolution + 1)
+	corner = index[:-1, :-1].ravel()
+	right = index[1:, :-1].ravel()
+	up = index[:-1, 1:].ravel()
+	diagonal = index[1:, 1:].ravel()
+	faces = np.concatenate((
+		np.column_stack((corner, right, diagonal)),
+		np.column_stack((corner, diagonal, up))))
+
+	return vertices, faces
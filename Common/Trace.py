@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import time
+import numpy as np
+from PySide6.QtCore import QObject, QEvent, QPointF, Qt
+from PySide6.QtGui import QCursor, QKeyEvent, QMouseEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+TRACE_VERSION = 2
+MOUSE_EVENTS = {
+	QEvent.Type.MouseButtonPress: 'press',
+	QEvent.Type.MouseMove: 'move',
+	QEvent.Type.MouseButtonRelease: 'release'}
+KEY_EVENTS = {
+	QEvent.Type.KeyPress: 'key_press',
+	QEvent.Type.KeyRelease: 'key_release'}
+REPLAYED_MOUSE_EVENTS = {name: event_type for event_type, name in MOUSE_EVENTS.items()}
+REPLAYED_KEY_EVENTS = {name: event_type for event_type, name in KEY_EVENTS.items()}
+PERCENTILES = (50, 90, 99)
+FLUSH_TIMEOUT = 10.0
+
+class TraceRecorder(QObject):
+	"""
+	The recorder of the user input and UI actions of the PlotWindow.
+
+	The trace is written as json lines, the header with the version and metadata first and
+	then one line per event flushed as it arrives, so the trace of a killed session is kept.
+	"""
+
+	def __init__(self, window: QWidget, file_path: str, metadata: dict | None = None) -> None:
+		"""
+		TraceRecorder class initialization.
+
+		Attributes:
+			window(QWidget): the PlotWindow to record.
+			file_path(str): path of the trace file.
+			metadata(dict): additional information saved with the trace, e.g. the scene resolution.
+		"""
+		super().__init__(window)
+		self.window = window
+		self.widget = window.plot_widget()
+		self.metadata = metadata if metadata is not None else {}
+		self.last_mouse_event = None
+		self.last_key_event = None
+		self.last_size = None
+		self.file = open(file_path, "w", encoding="utf-8")
+		self.write({'version': TRACE_VERSION, 'metadata': self.metadata})
+		self.start_time = time.perf_counter()
+
+		QApplication.instance().installEventFilter(self)
+
+		if hasattr(window.ui, 'chkAxis'):
+			window.ui.chkAxis.clicked.connect(self.record_axis)
+
+		if hasattr(window.chart, 'pick_listeners'):
+			window.chart.pick_listeners.append(self.record_pick)
+
+	def write(self, line: dict) -> None:
+		"""Write the json line and flush it to the file."""
+		if self.file.closed:
+			return
+		self.file.write(json.dumps(line) + '\n')
+		self.file.flush()
+
+	def record(self, event_type: str, **data) -> None:
+		"""Write the event with the time since the start of recording."""
+		self.write({'time': time.perf_counter() - self.start_time, 'type': event_type, **data})
+
+	def close(self) -> None:
+		"""Stop recording and close the trace file."""
+		QApplication.instance().removeEventFilter(self)
+		self.file.close()
+
+	def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+		"""Record mouse presses, releases and drags and key presses over the plot widget and window resizes."""
+		if event.type() == QEvent.Type.Resize and watched is self.window:
+			self.record_resize()
+			return False
+
+		if event.type() not in MOUSE_EVENTS and event.type() not in KEY_EVENTS:
+			return False
+
+		if not isinstance(watched, QWidget) or (watched is not self.widget and not self.widget.isAncestorOf(watched)):
+			return False
+
+		if event.type() in KEY_EVENTS:
+			self.record_key(event)
+			return False
+
+		if event.type() == QEvent.Type.MouseMove and event.buttons() == Qt.MouseButton.NoButton:
+			return False
+
+		key = (event.type(), event.timestamp(), event.globalPosition().toTuple())
+		if key == self.last_mouse_event:
+			return False
+		self.last_mouse_event = key
+
+		position = self.widget.mapFromGlobal(event.globalPosition())
+		self.record(
+			MOUSE_EVENTS[event.type()],
+			x=position.x() / max(1, self.widget.width()),
+			y=position.y() / max(1, self.widget.height()),
+			button=event.button().value,
+			buttons=event.buttons().value)
+		return False
+
+	def record_key(self, event: QKeyEvent) -> None:
+		"""
+		Record the key event with the cursor position.
+
+		Hover moves are not recorded, so the position is needed by key triggered picks, e.g. the pyvista P key.
+		"""
+		key = (event.type(), event.timestamp(), event.key())
+		if key == self.last_key_event:
+			return
+		self.last_key_event = key
+
+		position = self.widget.mapFromGlobal(QCursor.pos())
+		self.record(
+			KEY_EVENTS[event.type()],
+			x=position.x() / max(1, self.widget.width()),
+			y=position.y() / max(1, self.widget.height()),
+			key=event.key(),
+			modifiers=event.modifiers().value,
+			text=event.text(),
+			auto_repeat=event.isAutoRepeat())
+
+	def record_axis(self, checked: bool) -> None:
+		"""Record the axis checkbox toggle."""
+		self.record('axis', checked=checked)
+
+	def record_pick(self, point: tuple) -> None:
+		"""Record the point picked by the canvas."""
+		self.record('pick', point=[float(i) for i in point])
+
+	def record_resize(self) -> None:
+		"""Record the new window size, the resize events repeated with the same size are skipped."""
+		size = [self.window.width(), self.window.height()]
+		if size == self.last_size:
+			return
+		self.last_size = size
+		self.record('resize', width=size[0], height=size[1])
+
+def load_trace(file_path: str) -> dict:
+	"""
+	Load the trace written by TraceRecorder.
+
+	The incomplete last line of the trace of a killed session is ignored.
+	"""
+	with open(file_path, "r", encoding="utf-8") as f:
+		lines = f.read().splitlines()
+
+	try:
+		header = json.loads(lines[0]) if lines else {}
+	except ValueError:
+		header = {}
+
+	version = header.get('version') if isinstance(header, dict) else None
+	if version != TRACE_VERSION:
+		raise ValueError(f"Unsupported trace version {version} in '{file_path}'")
+
+	events = []
+	for number, line in enumerate(lines[1:], 2):
+		try:
+			events.append(json.loads(line))
+		except ValueError:
+			if number < len(lines):
+				raise ValueError(f"Invalid trace event on line {number} of '{file_path}'")
+
+	return {'version': version, 'metadata': header.get('metadata', {}), 'events': events}
+
+class TraceReplayer():
+	"""The replayer driving the PlotWindow by the recorded trace and measuring the latency of events."""
+
+	def __init__(self, window: QWidget, trace: dict, speed: float = 1.0) -> None:
+		"""
+		TraceReplayer class initialization.
+
+		Attributes:
+			window(QWidget): the PlotWindow of any backend.
+			trace(dict): the trace from load_trace.
+			speed(float): replay speed relative to the recording, 0 replays without pauses.
+		"""
+		self.window = window
+		self.trace = trace
+		self.speed = speed
+		self.app = QApplication.instance()
+		self.redraw_pending = getattr(window.chart, 'redraw_pending', None)
+
+		widget = window.plot_widget()
+		self.widget = widget.focusProxy() or widget
+
+	def run(self) -> dict[str, list[float]]:
+		"""Replay the trace and return the latencies in seconds grouped by the event type."""
+		self.window.show()
+		self.app.processEvents()
+
+		latencies = {}
+		start = time.perf_counter()
+		for event in self.trace['events']:
+			if self.speed > 0:
+				self.wait_until(start + event['time'] / self.speed)
+
+			begin = time.perf_counter()
+			if not self.dispatch(event):
+				continue
+			self.flush()
+			latencies.setdefault(event['type'], []).append(time.perf_counter() - begin)
+
+		return latencies
+
+	def flush(self) -> None:
+		"""Process the Qt events until the canvas has drawn the frame requested by the event, including throttled redraws."""
+		self.app.processEvents()
+		deadline = time.perf_counter() + FLUSH_TIMEOUT
+		while self.redraw_pending is not None and self.redraw_pending() and time.perf_counter() < deadline:
+			self.app.processEvents()
+			time.sleep(0.0005)
+
+	def wait_until(self, deadline: float) -> None:
+		"""Process the Qt events, e.g. throttled redraws, until the deadline."""
+		while time.perf_counter() < deadline:
+			self.app.processEvents()
+			time.sleep(min(0.001, max(0.0, deadline - time.perf_counter())))
+
+	def dispatch(self, event: dict) -> bool:
+		"""
+		Send the recorded event to the window, return False if it is not replayable.
+
+		Picks are not sent, they are reproduced by the replayed mouse presses (matplotlib)
+		and key presses at the recorded cursor position (pyvista P key).
+		"""
+		if event['type'] in REPLAYED_MOUSE_EVENTS:
+			self.send_mouse(REPLAYED_MOUSE_EVENTS[event['type']], event['x'], event['y'], event['button'], event['buttons'])
+			return True
+
+		if event['type'] in REPLAYED_KEY_EVENTS:
+			if event['type'] == 'key_press':
+				self.send_mouse(QEvent.Type.MouseMove, event['x'], event['y'], 0, 0)
+			key_event = QKeyEvent(
+				REPLAYED_KEY_EVENTS[event['type']],
+				event['key'],
+				Qt.KeyboardModifier(event['modifiers']),
+				event['text'],
+				event['auto_repeat'])
+			QApplication.sendEvent(self.widget, key_event)
+			return True
+
+		if event['type'] == 'resize':
+			self.window.resize(event['width'], event['height'])
+			self.app.processEvents()
+			return False
+
+		if event['type'] == 'axis' and hasattr(self.window.ui, 'chkAxis'):
+			self.window.ui.chkAxis.setChecked(not event['checked'])
+			self.window.ui.chkAxis.click()
+			return True
+
+		return False
+
+	def send_mouse(self, event_type: QEvent.Type, x: float, y: float, button: int, buttons: int) -> None:
+		"""Send the mouse event at the position relative to the widget size."""
+		local = QPointF(x * self.widget.width(), y * self.widget.height())
+		mouse_event = QMouseEvent(
+			event_type,
+			local,
+			self.widget.mapToGlobal(local),
+			Qt.MouseButton(button),
+			Qt.MouseButton(buttons),
+			Qt.KeyboardModifier.NoModifier)
+		QApplication.sendEvent(self.widget, mouse_event)
+
+def latency_report(latencies: dict[str, list[float]]) -> str:
+	"""Format the latency percentiles in milliseconds for every event type and all events."""
+	groups = {**latencies, 'all': [value for values in latencies.values() for value in values]}
+	lines = [f"{'event':<12}{'count':>8}" + ''.join(f"{f'p{p}':>10}" for p in PERCENTILES) + f"{'max':>10}"]
+
+	for name, values in groups.items():
+		if not values:
+			continue
+		milliseconds = np.array(values) * 1000
+		lines.append(
+			f"{name:<12}{len(values):>8}"
+			+ ''.join(f"{value:>10.2f}" for value in np.percentile(milliseconds, PERCENTILES))
+			+ f"{milliseconds.max():>10.2f}")
+
+	return '\n'.join(lines)
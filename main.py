@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import argparse
+import PySide6
+from PySide6.QtWidgets import QApplication
+from Common.Scene import Scene
+from Common.Backends import BACKENDS, get_backend, select_backend
+from Common.Benchmark import load_thresholds
+from Common.Export import EXPORTERS, export_scene
+from Common.Trace import TraceRecorder, TraceReplayer, load_trace, latency_report
+
+dirname = os.path.dirname(PySide6.__file__)
+plugin_path = os.path.join(dirname, 'plugins', 'platforms')
+os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = plugin_path
+
+def parse_arguments() -> argparse.Namespace:
+	"""Parse the command line arguments."""
+	parser = argparse.ArgumentParser(description='Display the capacitor model with the chosen backend.')
+	parser.add_argument('--backend', choices=['auto', *BACKENDS], default='auto', help='rendering backend, chosen by the scene complexity by default')
+	parser.add_argument('--resolution', type=int, help='number of grid cells along the electrode edge, 1 or the replayed trace resolution by default')
+	parser.add_argument('--share', action='store_true', help='prefer the backend producing the shareable html file')
+	parser.add_argument('--recalibrate', action='store_true', help='run the backend benchmark again')
+	parser.add_argument('--export', metavar='FILE', help='save the scene as .glb or .vtp file and exit')
+	parser.add_argument('--no-compress', action='store_true', help='write uncompressed arrays to the exported .vtp file, .glb arrays are always uncompressed')
+	parser.add_argument('--record', metavar='FILE', help='write the trace of the user input to the json lines file while running')
+	parser.add_argument('--replay', metavar='FILE', help='replay the trace headlessly and print the event latencies')
+	parser.add_argument('--replay-speed', type=float, default=1.0, help='replay speed relative to the recording, 0 replays without pauses')
+	arguments = parser.parse_args()
+
+	if arguments.export and os.path.splitext(arguments.export)[1].lower() not in EXPORTERS:
+		parser.error(f"unsupported export format of '{arguments.export}', available: {', '.join(EXPORTERS)}")
+
+	return arguments
+
+if __name__ == '__main__':
+	arguments = parse_arguments()
+	trace = load_trace(arguments.replay) if arguments.replay else None
+
+	resolution = arguments.resolution
+	if resolution is None:
+		resolution = trace['metadata'].get('resolution', 1) if trace else 1
+	scene = Scene.capacitor(resolution=resolution)
+
+	if arguments.export:
+		try:
+			export_scene(scene, arguments.export, not arguments.no_compress)
+		except OSError as error:
+			sys.exit(f"Export failed: \t{arguments.export} ({error.strerror or error})")
+		print(f"Exported: \t{arguments.export} ({scene.triangle_count} triangles)")
+		sys.exit()
+
+	if arguments.backend == 'auto':
+		backend = select_backend(scene, load_thresholds(arguments.recalibrate), arguments.share)
+	else:
+		backend = get_backend(arguments.backend)
+
+	print(f"Backend: \t{backend.name} ({scene.triangle_count} triangles)")
+
+	if trace:
+		os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+	app = QApplication(sys.argv[:1])
+
+	window = backend.create_window(scene)
+
+	if trace:
+		latencies = TraceReplayer(window, trace, arguments.replay_speed).run()
+		print(latency_report(latencies))
+		sys.exit()
+
+	if arguments.record:
+		recorder = TraceRecorder(window, arguments.record, {'backend': backend.name, 'resolution': resolution})
+		app.aboutToQuit.connect(recorder.close)
+
+	window.show()
+
+	sys.exit(app.exec())
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import time
 import numpy as np
 from mpl_toolkits.mplot3d import proj3d
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QFrame
 from matplotlib.figure import Figure
-from matplotlib.backend_bases import MouseEvent
+from matplotlib.backend_bases import MouseEvent, MouseButton
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from Common.Scene import Scene, Electrode, AXIS_COLORS
 
 class Canvas(FigureCanvas):
 	"""The canvas basic class."""
@@ -20,43 +24,64 @@ class Canvas(FigureCanvas):
 		self.canvas = FigureCanvas(self.figure)
 		self.axis = self.figure.add_subplot(111, projection='3d')
 		self.last_click_point = None
+		self.pick_listeners = []
 		self.mpl_connect('button_press_event', self.on_click)
 
+		self.interaction_triangles = 500
+		self.interaction_fps = 20
+		self.interacting = False
+		self.mouse_pressed = False
+		self.last_draw_time = 0.0
+		self.draw_requested = False
+		self.mpl_connect('button_press_event', self.on_press)
+		self.mpl_connect('motion_notify_event', self.on_move)
+		self.mpl_connect('button_release_event', self.on_release)
+
 		self.clear_plot()
 
 		super().__init__(self.figure)
 
-	def draw_capacitor(self, point_quanity: int, XYZ_start: list, XYZ_end: list, electrode_distance: float) -> None:
-		"""
-		Draw a model of capactior by position and distance between electodes.
+		self.redraw_timer = QTimer(self)
+		self.redraw_timer.setSingleShot(True)
+		self.redraw_timer.timeout.connect(self.throttled_redraw)
 
-		Attributes:
-			point_quanity(int): usualy 4 point to calculate a capacitor model.
-			XYZ_start(list): list of start points of capacitor.
-			XYZ_end(list): list of end points of capactior.
-			electrode_distance(float): distance between electrodes.
-		"""
+	def draw_scene(self, scene: Scene) -> None:
+		"""Draw the whole scene replacing the previous contents."""
+		self.clear_plot()
+		self.draw_arrow_axis(scene.arrow_length, scene.show_axis)
 
-		[x, y, z] = self.calculate_capacitor_sizes(XYZ_start, XYZ_end, electrode_distance)
+		for electrode in scene.electrodes:
+			collection = self.add_electrode(electrode, 'k')
+			preview = None
+			if electrode.triangle_count > self.interaction_triangles:
+				preview = self.add_electrode(electrode.decimate(self.interaction_triangles), 'none')
+				preview.set_visible(False)
 
-		self.set_data_points(x, y, z, electrode_distance)
+			self.electrode_collections.append((collection, preview))
 
-		N = point_quanity
+		if scene.electrodes:
+			self.data_points = np.concatenate([electrode.vertices for electrode in scene.electrodes]).astype(np.float64)
 
-		self.axis.fill_between(x[0], y[0], z[0], x[1], y[1], z[1], alpha=0.5, edgecolor='k')
-		self.axis.fill_between(x[2], y[2], z[2], x[3], y[3], z[3], alpha=0.5, edgecolor='k')
 		self.setParent(self.parent_app)
-
-	def calculate_capacitor_sizes(self, XYZ_start: list, XYZ_end: list, electrode_distance: float) -> list[list, list, list]:
-		"""Calculate start and end points of capacitor."""
-		x_axis = [XYZ_start[0], XYZ_end[0], XYZ_start[0], XYZ_end[0]]
-		y_axis = [XYZ_start[1], XYZ_end[1], XYZ_start[1], XYZ_end[1]]
-		z_axis = [XYZ_start[2], XYZ_end[2], XYZ_start[2] + electrode_distance, XYZ_end[2] + electrode_distance]
-
-		return[x_axis, y_axis, z_axis]
+		self.draw_idle()
+
+	def add_electrode(self, electrode: Electrode, edgecolor: str) -> Poly3DCollection:
+		"""Add the electrode triangles to the axis."""
+		collection = Poly3DCollection(
+			electrode.triangles(),
+			facecolor=electrode.color,
+			edgecolor=edgecolor,
+			alpha=electrode.opacity,
+			label=electrode.name)
+		self.axis.add_collection3d(collection)
+		return collection
 
 	def draw_arrow_axis(self, arrow_length: float=0.1, enable_axis: bool=True) -> None:
-		"""Draw an axis arrows if they enabled."""
+		"""Replace the current axis arrows, with enable_axis=False only remove them."""
+		for artist in self.axis_artists:
+			artist.remove()
+		self.axis_artists = []
+
 		if enable_axis:
 			origin = [0, 0, 0]
 			
@@ -64,19 +89,28 @@ class Canvas(FigureCanvas):
 			y_axis = [0, arrow_length, 0] 
 			z_axis = [0, 0, arrow_length]
 
-			colors = ['red', 'green', 'blue']
+			colors = AXIS_COLORS
 			
-			self.axis.quiver(*origin, *x_axis, color=colors[0], arrow_length_ratio=0.1, linewidth=1)
-			self.axis.quiver(*origin, *y_axis, color=colors[1], arrow_length_ratio=0.1, linewidth=1)
-			self.axis.quiver(*origin, *z_axis, color=colors[2], arrow_length_ratio=0.1, linewidth=1)
-			
-			self.axis.text(arrow_length * 1.1, 0, 0, "X", color=colors[0], fontsize=5)
-			self.axis.text(0, arrow_length * 1.1, 0, "Y", color=colors[1], fontsize=5)
-			self.axis.text(0, 0, arrow_length * 1.1, "Z", color=colors[2], fontsize=5)
+			self.axis_artists = [
+				self.axis.quiver(*origin, *x_axis, color=colors[0], arrow_length_ratio=0.1, linewidth=1),
+				self.axis.quiver(*origin, *y_axis, color=colors[1], arrow_length_ratio=0.1, linewidth=1),
+				self.axis.quiver(*origin, *z_axis, color=colors[2], arrow_length_ratio=0.1, linewidth=1),
+				self.axis.text(arrow_length * 1.1, 0, 0, "X", color=colors[0], fontsize=5),
+				self.axis.text(0, arrow_length * 1.1, 0, "Y", color=colors[1], fontsize=5),
+				self.axis.text(0, 0, arrow_length * 1.1, "Z", color=colors[2], fontsize=5)]
+
+			if self.interacting:
+				for text in self.axis_artists[3:]:
+					text.set_visible(False)
+
+		self.draw_idle()
 
 	def clear_plot(self) -> None:
 		"""Clear an axis and plot."""
 		self.axis.cla()
+		self.electrode_collections = []
+		self.axis_artists = []
+		self.data_points = np.zeros((0, 3))
 		self.axis.set_axis_off()
 		self.axis.set(xlim=(0, 1), ylim=(0, 1), zlim=(0, 1))
 		self.axis.set_aspect('equal', 'box')
@@ -86,7 +120,7 @@ class Canvas(FigureCanvas):
 		if event.inaxes != self.axis:
 			return
 
-		if str(event.button) != 'MouseButton.RIGHT':
+		if event.button != MouseButton.RIGHT:
 			return
 
 		self.clear_selection()
@@ -97,42 +131,23 @@ class Canvas(FigureCanvas):
 			self.last_click_point = closest_point
 			x3d, y3d, z3d = closest_point
 			print(f"Clicked position: \tx={x3d:.2f}, y={y3d:.2f}, z={z3d:.2f}")
+			for listener in self.pick_listeners:
+				listener(closest_point)
 			
 			self.axis.scatter([x3d], [y3d], [z3d], color='red', s=100, marker='o', zorder=100)
 			self.draw_idle()
 	
 	def find_closest_data_point(self, x2d: np.float64, y2d: np.float64) -> tuple | None:
 		"""Find a closest point from data with points position."""
-		if not self.data_points:
+		if not len(self.data_points):
 			return None
-					
-		min_distance = float('inf')
-		closest_point = None
-		
-		for point in self.data_points:
-			x3d, y3d, z3d = point
-			x2d_proj, y2d_proj, _ = proj3d.proj_transform(x3d, y3d, z3d, self.axis.get_proj())			
-			distance = np.sqrt((x2d_proj - x2d)**2 + (y2d_proj - y2d)**2)
-			
-			if distance < min_distance:
-				min_distance = distance
-				closest_point = point
 
-		return closest_point
-	
-	def set_data_points(self, x_coords: list, y_coords: list, z_coords: list, electrode_distance: float = 0.2) -> None:
-		"""Set data points to find the closest point, taking into account the distance between electrodes."""
-		self.data_points = []
-		
-		for i in range(len(x_coords)):
-			y_start = y_coords[i][0]
-			y_end = y_coords[i][1]
-			
-			self.data_points.append((x_coords[i], y_start, 0))
-			self.data_points.append((x_coords[i], y_end, 0))	        
-			self.data_points.append((x_coords[i], y_start, electrode_distance))
-			self.data_points.append((x_coords[i], y_end, electrode_distance))
+		x3d, y3d, z3d = self.data_points.T
+		x2d_proj, y2d_proj, _ = proj3d.proj_transform(x3d, y3d, z3d, self.axis.get_proj())
+		closest = np.argmin((x2d_proj - x2d)**2 + (y2d_proj - y2d)**2)
 
+		return tuple(self.data_points[closest].tolist())
+	
 	def clear_selection(self) -> None:
 		"""Clear point selection."""
 		self.last_click_point = None
@@ -146,4 +161,69 @@ class Canvas(FigureCanvas):
 		for collection in collections_to_remove:
 			collection.remove()
 		
-		self.draw_idle()
\ No newline at end of file
+		self.draw_idle()
+
+	def on_press(self, event: MouseEvent) -> None:
+		"""Remember the pressed mouse button to detect the dragging."""
+		self.mouse_pressed = event.inaxes == self.axis
+
+	def on_move(self, event: MouseEvent) -> None:
+		"""Switch to the fast rendering mode when the axis is dragged."""
+		if self.mouse_pressed and not self.interacting:
+			self.set_interaction_mode(True)
+
+	def on_release(self, event: MouseEvent) -> None:
+		"""Restore the full quality rendering after the dragging."""
+		self.mouse_pressed = False
+		if self.interacting:
+			self.set_interaction_mode(False)
+			self.redraw_timer.stop()
+			self.draw_idle()
+
+	def set_interaction_mode(self, enable: bool) -> None:
+		"""
+		Switch between the fast and the full quality rendering.
+
+		The fast mode hides labels, drops edges, replaces electrodes with the decimated
+		previews and skips the depth sort between collections.
+		"""
+		self.interacting = enable
+		self.axis.computed_zorder = not enable
+
+		for text in self.axis.texts:
+			text.set_visible(not enable)
+
+		for collection, preview in self.electrode_collections:
+			if preview is None:
+				collection.set_edgecolor('none' if enable else 'k')
+				continue
+
+			collection.set_visible(not enable)
+			preview.set_visible(enable)
+
+	def draw_idle(self, *args, **kwargs) -> None:
+		"""Request the redraw, limited to interaction_fps while the axis is dragged."""
+		self.draw_requested = True
+		if not self.interacting:
+			super().draw_idle(*args, **kwargs)
+			return
+
+		remaining = 1 / self.interaction_fps - (time.perf_counter() - self.last_draw_time)
+		if remaining <= 0:
+			self.throttled_redraw()
+		elif not self.redraw_timer.isActive():
+			self.redraw_timer.start(int(remaining * 1000))
+
+	def throttled_redraw(self) -> None:
+		"""Redraw the canvas and remember the time of the redraw."""
+		self.last_draw_time = time.perf_counter()
+		super().draw_idle()
+
+	def draw(self) -> None:
+		"""Render the figure and clear the pending redraw request."""
+		super().draw()
+		self.draw_requested = False
+
+	def redraw_pending(self) -> bool:
+		"""Return True while the requested or throttled redraw has not been drawn yet."""
+		return self.draw_requested or self.redraw_timer.isActive()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 
 import plotly.graph_objects as go
+from Common.Scene import Scene, AXIS_COLORS
 
 class Canvas():
 	"""The canvas basic class."""
@@ -9,63 +10,70 @@ class Canvas():
 	def __init__(self) -> None:
 		"""Canvas class initialization."""
 		self.fig = go.Figure()
-		self.draw_arrow_axis()
 
-	def draw_capacitor(self, points: list[list, list, list], electrode_distance: float) -> None:
-		"""
-		Draw a capacitor by positions.
+	def draw_scene(self, scene: Scene) -> None:
+		"""Draw the whole scene replacing the previous contents."""
+		self.clear_plot()
+		self.draw_arrow_axis(scene.arrow_length, scene.show_axis)
 
-		Atttributes:
-			points(list): the list of lists with start and end points of electrodes.
-			electrode_distance(float): the distance between electrodes. 
-		"""
+		for electrode in scene.electrodes:
+			vertices = electrode.vertices
+			faces = electrode.faces
+			self.fig.add_trace(go.Mesh3d(
+				x=vertices[:, 0],
+				y=vertices[:, 1],
+				z=vertices[:, 2],
+				i=faces[:, 0],
+				j=faces[:, 1],
+				k=faces[:, 2],
+				opacity=electrode.opacity,
+				color=electrode.rgba_string(),
+				name=electrode.name))
 
-		self.fig.add_trace(go.Mesh3d(
-			x=points[0],
-			y=points[1],
-			z=points[2],
-			opacity=0.5,
-			color='rgba(244,22,100,0.6)',
-			name="Bottom electrode"))
-		
-		self.fig.add_trace(go.Mesh3d(
-			x=points[0],
-			y=points[1],
-			z=[i + electrode_distance for i in points[2]],
-			opacity=0.5,
-			color='rgba(100,22,244,0.6)',
-			name="Top electrode"))
+		self.update_figure_layout()
+
+	def clear_plot(self) -> None:
+		"""Remove all traces from the figure."""
+		self.fig = go.Figure()
+
+	def draw_arrow_axis(self, arrow_length: float=0.1, enable_axis: bool=True) -> None:
+		"""Replace the current axis arrows, with enable_axis=False only remove them."""
+		self.fig.data = [trace for trace in self.fig.data if trace.meta != 'axis']
+		if not enable_axis:
+			return
 
-	def draw_arrow_axis(self, arrow_length: float=0.1) -> None:
-		"""Draw the axis arrows."""
 		self.fig.add_trace(go.Scatter3d(
 			x=[0, arrow_length, None, 0, 0, None, 0, 0],
 			y=[0, 0, None, 0, arrow_length, None, 0, 0],
 			z=[0, 0, None, 0, 0, None, 0, arrow_length],
 			mode='lines',
 			line=dict(width=5, color='black'),
-			showlegend=False))
+			showlegend=False,
+			meta='axis'))
 
 		self.fig.add_trace(go.Scatter3d(
 			x=[arrow_length * 1.1], y=[0], z=[0],
 			mode='text',
 			text=['X'],
-			textfont=dict(size=10, color='red'),
-			showlegend=False))
+			textfont=dict(size=10, color=AXIS_COLORS[0]),
+			showlegend=False,
+			meta='axis'))
 		
 		self.fig.add_trace(go.Scatter3d(
 			x=[0], y=[arrow_length * 1.1], z=[0],
 			mode='text',
 			text=['Y'],
-			textfont=dict(size=10, color='green'),
-			showlegend=False))
+			textfont=dict(size=10, color=AXIS_COLORS[1]),
+			showlegend=False,
+			meta='axis'))
 		
 		self.fig.add_trace(go.Scatter3d(
 			x=[0], y=[0], z=[arrow_length * 1.1],
 			mode='text',
 			text=['Z'],
-			textfont=dict(size=10, color='blue'),
-			showlegend=False))
+			textfont=dict(size=10, color=AXIS_COLORS[2]),
+			showlegend=False,
+			meta='axis'))
 
 	def update_figure_layout(self) -> None:
 		"""Update the figure layout."""
@@ -7,13 +7,15 @@ from PySide6 import QtCore
 from PySide6.QtWidgets import QWidget
 from Source._windows.plot_window import Ui_Form
 from Source.Canvas import Canvas as Canvas
+from Common.Scene import Scene
 
 class PlotWindow(QWidget):
 	"""Main window of the program."""
 
-	def __init__(self) -> None:
+	def __init__(self, scene: Scene | None = None) -> None:
 		"""Class initialization."""
 		super(PlotWindow, self).__init__()
+		self.scene = scene if scene is not None else Scene.capacitor()
 
 		self.ui = Ui_Form()
 		self.ui.setupUi(self)
@@ -36,6 +38,9 @@ class PlotWindow(QWidget):
 	
 	def draw_capacitor(self) -> None:
 		"""Draw the capacitor by position."""
-		self.chart.draw_capacitor([[0, 1, 0, 1],[0, 0, 1, 1],[0, 0, 0, 0]], 0.2)
-		self.chart.update_figure_layout()	
+		self.chart.draw_scene(self.scene)
 		self.update_browser_contents()
+
+	def plot_widget(self) -> QWidget:
+		"""Return the widget receiving the mouse input of the plot."""
+		return self.browser
@@ -3,9 +3,9 @@
 
 import numpy
 import pyvista as pv
-from pyvista.core.pointset import PolyData
 from pyvistaqt import QtInteractor
 from PySide6.QtWidgets import QFrame, QSizePolicy
+from Common.Scene import Scene, AXIS_COLORS
 
 class Canvas():
 	"""The canvas basic class."""
@@ -17,24 +17,37 @@ class Canvas():
 		self.plotter.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
 
 		self.axis_actors = []
+		self.electrode_actors = []
+		self.picking_enabled = False
+		self.pick_listeners = []
 
-	def draw_capacitor(self, bottom_electrode: PolyData, top_electrode: PolyData) -> None:
-		"""
-		Draw the capcaitor by PolyData.
+	def draw_scene(self, scene: Scene) -> None:
+		"""Draw the whole scene replacing the previous contents."""
+		self.clear_plot()
 
-		Attributes:
-			bottom_electrode(PolyData): points of bottom electrode.
-			top_electrode(PolyData): points of top electrode.
-		"""
-
-		self.plotter.add_mesh(bottom_electrode, color='blue', opacity=0.7)
-		self.plotter.add_mesh(top_electrode, color='red', opacity=0.7)
+		for electrode in scene.electrodes:
+			faces = numpy.column_stack((numpy.full(electrode.triangle_count, 3), electrode.faces)).ravel()
+			mesh = pv.PolyData(electrode.vertices, faces)
+			actor = self.plotter.add_mesh(mesh, color=electrode.color, opacity=electrode.opacity, name=electrode.name)
+			self.electrode_actors.append(actor)
 
+		self.draw_arrow_axis(scene.arrow_length, scene.show_axis)
 		self.plotter.camera_position = 'xy'
 		self.plotter.reset_camera()
-		self.setup_plotter_picker()
+
+		if not self.picking_enabled:
+			self.setup_plotter_picker()
+			self.picking_enabled = True
+
 		self.plotter.update()
 
+	def clear_plot(self) -> None:
+		"""Remove all electrodes and axis arrows."""
+		for actor in self.electrode_actors + self.axis_actors:
+			self.plotter.remove_actor(actor)
+		self.electrode_actors = []
+		self.axis_actors = []
+
 	def setup_plotter_picker(self, tolerance: float = 0.1, point_size: int = 10) -> None:
 		"""Setup the point picking function."""
 		self.plotter.enable_point_picking(
@@ -47,9 +60,11 @@ class Canvas():
 		"""Show position of click."""
 		point = [round(i, 5) for i in point.tolist()]
 		print(f'Clicked position: \tx = {point[0]}, y = {point[1]}, z = {point[2]}')
+		for listener in self.pick_listeners:
+			listener(point)
 
 	def draw_arrow_axis(self, arrow_length: float = 0.1, enable_axis: bool = True) -> None:
-		"""Draw an axis arrows."""
+		"""Replace the current axis arrows, with enable_axis=False only remove them."""
 		for actor in self.axis_actors:
 			self.plotter.remove_actor(actor)
 		self.axis_actors = []
@@ -63,24 +78,24 @@ class Canvas():
 		y_axis = pv.Arrow(start=origin, direction=[0, arrow_length, 0], scale='auto')
 		z_axis = pv.Arrow(start=origin, direction=[0, 0, arrow_length], scale='auto')
 
-		actor_x = self.plotter.add_mesh(x_axis, color='red')
-		actor_y = self.plotter.add_mesh(y_axis, color='green')
-		actor_z = self.plotter.add_mesh(z_axis, color='blue')
+		actor_x = self.plotter.add_mesh(x_axis, color=AXIS_COLORS[0])
+		actor_y = self.plotter.add_mesh(y_axis, color=AXIS_COLORS[1])
+		actor_z = self.plotter.add_mesh(z_axis, color=AXIS_COLORS[2])
 
 		text_actor_x = self.plotter.add_point_labels([(arrow_length * 1.1, 0, 0)], ['X'], 
-													text_color='red', 
+													text_color=AXIS_COLORS[0], 
 													font_size=10, 
 													show_points=False, 
 													shape=None)
 
 		text_actor_y = self.plotter.add_point_labels([(0, arrow_length * 1.1, 0)], ['Y'], 
-													text_color='green', 
+													text_color=AXIS_COLORS[1], 
 													font_size=10, 
 													show_points=False,
 													shape=None)
 
 		text_actor_z = self.plotter.add_point_labels([(0, 0, arrow_length * 1.1)], ['Z'], 
-													text_color='blue',
+													text_color=AXIS_COLORS[2],
 													font_size=10, 
 													show_points=False,
 													shape=None)
@@ -8,13 +8,15 @@ from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from Source._windows.plot_window import Ui_Form
 from Source.Canvas import Canvas as Canvas
+from Common.Scene import Scene
 
 class PlotWindow(QWidget):
 	"""Main window of the program."""
 
-	def __init__(self) -> None:
+	def __init__(self, scene: Scene | None = None) -> None:
 		"""Class initialization."""
 		super(PlotWindow, self).__init__()
+		self.scene = scene if scene is not None else Scene.capacitor()
 
 		self.ui = Ui_Form()
 		self.ui.setupUi(self)
@@ -26,6 +28,7 @@ class PlotWindow(QWidget):
 	def initialize_ui(self) -> None:
 		"""Initialize the user interface."""
 		self.setWindowTitle('3D pyvista model test')
+		self.ui.chkAxis.setChecked(self.scene.show_axis)
 		self.ui.chkAxis.clicked.connect(self.change_axis_state)
 
 		if self.ui.framePlot.layout() is None:
@@ -37,14 +40,13 @@ class PlotWindow(QWidget):
 
 	def draw_capacitor(self) -> None:
 		"""Draw an capacitor."""
-		bottom_electrode = pv.Plane(center=(0.5, 0.5, 0), direction=(0, 0, 1), i_size=1, j_size=1)
-		top_electrode = pv.Plane(center=(0.5, 0.5, 0.2), direction=(0, 0, 1), i_size=1, j_size=1)
-		self.chart.draw_capacitor(bottom_electrode, top_electrode)
+		self.chart.draw_scene(self.scene)
 
 	def change_axis_state(self):
 		"""Enable/disable an axis arrows."""
-		if self.ui.chkAxis.checkState() == Qt.Checked:
-			self.chart.draw_arrow_axis(0.1, True)
-			return
+		self.scene.show_axis = self.ui.chkAxis.checkState() == Qt.Checked
+		self.chart.draw_arrow_axis(self.scene.arrow_length, self.scene.show_axis)
 
-		self.chart.draw_arrow_axis(0.1, False)
+	def plot_widget(self) -> QWidget:
+		"""Return the widget receiving the mouse input of the plot."""
+		return self.chart.plotter
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import platform
+import pytest
+from Common import Benchmark
+
+@pytest.fixture
+def calibration(monkeypatch):
+	"""Replace the benchmark by the constant thresholds and count its runs."""
+	runs = []
+
+	def calibrate():
+		runs.append(1)
+		return {'matplotlib_max_triangles': 1234}
+
+	monkeypatch.setattr(Benchmark, 'calibrate', calibrate)
+	return runs
+
+@pytest.mark.parametrize('contents', ['', '{"host": {"matplotlib_max', '[1, 2]', f'{{"{platform.node()}": 5}}'])
+def test_corrupt_cache_is_recalibrated(tmp_path, calibration, contents):
+	file_path = tmp_path / 'calibration.json'
+	file_path.write_text(contents, encoding='utf-8')
+
+	thresholds = Benchmark.load_thresholds(file_path=str(file_path))
+
+	assert thresholds['matplotlib_max_triangles'] == 1234
+	assert len(calibration) == 1
+	assert json.loads(file_path.read_text(encoding='utf-8')) == {platform.node(): {'matplotlib_max_triangles': 1234}}
+
+def test_cache_is_reused(tmp_path, calibration):
+	file_path = str(tmp_path / 'cache' / 'calibration.json')
+
+	Benchmark.load_thresholds(file_path=file_path)
+	thresholds = Benchmark.load_thresholds(file_path=file_path)
+
+	assert thresholds['matplotlib_max_triangles'] == 1234
+	assert len(calibration) == 1
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import struct
+import xml.etree.ElementTree as ElementTree
+import numpy as np
+import pytest
+from Common.Scene import Scene, Electrode
+from Common.Export import export_glb, export_vtp, GLB_MAGIC, GLB_JSON_CHUNK, GLB_BIN_CHUNK
+
+CHUNK_SIZES = [1 << 20, 1000, 1001, 7]
+
+def read_glb(file_path: str) -> tuple[dict, bytes]:
+	"""Parse the glb file and check its header and chunk alignment."""
+	with open(file_path, "rb") as f:
+		data = f.read()
+
+	magic, version, length = struct.unpack_from('<III', data, 0)
+	assert (magic, version, length) == (GLB_MAGIC, 2, len(data))
+
+	json_length, json_type = struct.unpack_from('<II', data, 12)
+	assert json_type == GLB_JSON_CHUNK and json_length % 4 == 0
+	gltf = json.loads(data[20:20 + json_length])
+
+	bin_length, bin_type = struct.unpack_from('<II', data, 20 + json_length)
+	assert bin_type == GLB_BIN_CHUNK and bin_length % 4 == 0
+	binary = data[28 + json_length:]
+	assert len(binary) == bin_length == gltf['buffers'][0]['byteLength']
+
+	return gltf, binary
+
+def accessor_array(gltf: dict, binary: bytes, index: int) -> np.ndarray:
+	"""Return the data of the glTF accessor."""
+	accessor = gltf['accessors'][index]
+	view = gltf['bufferViews'][accessor['bufferView']]
+	assert view['byteOffset'] % 4 == 0
+	dtype = {5126: '<f4', 5125: '<u4'}[accessor['componentType']]
+	array = np.frombuffer(binary, dtype, view['byteLength'] // 4, view['byteOffset'])
+	return array.reshape(accessor['count'], -1)
+
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_glb_round_trip(tmp_path, chunk_size):
+	scene = Scene.capacitor(resolution=7)
+	file_path = tmp_path / 'scene.glb'
+	export_glb(scene, str(file_path), chunk_size)
+
+	gltf, binary = read_glb(str(file_path))
+	assert len(gltf['meshes']) == len(scene.electrodes) + 1
+
+	for mesh, electrode in zip(gltf['meshes'], scene.electrodes):
+		primitive = mesh['primitives'][0]
+		np.testing.assert_array_equal(accessor_array(gltf, binary, primitive['attributes']['POSITION']), electrode.vertices)
+		np.testing.assert_array_equal(accessor_array(gltf, binary, primitive['indices']).reshape(-1, 3), electrode.faces)
+
+def test_glb_skips_empty_electrode(tmp_path):
+	scene = Scene([Electrode("Empty", np.zeros((0, 3)), np.zeros((0, 3)), (1, 0, 0))], show_axis=False)
+	file_path = tmp_path / 'empty.glb'
+	export_glb(scene, str(file_path))
+
+	gltf, binary = read_glb(str(file_path))
+	assert gltf['meshes'] == [] and binary == b''
+
+@pytest.mark.parametrize('compress', [True, False])
+@pytest.mark.parametrize('chunk_size', CHUNK_SIZES)
+def test_vtp_round_trip(tmp_path, compress, chunk_size):
+	vtk = pytest.importorskip('vtk')
+	from vtk.util.numpy_support import vtk_to_numpy
+
+	scene = Scene.capacitor(resolution=7)
+	file_path = tmp_path / 'scene.vtp'
+	export_vtp(scene, str(file_path), compress, chunk_size)
+
+	reader = vtk.vtkXMLPolyDataReader()
+	reader.SetFileName(str(file_path))
+	reader.Update()
+	assert not reader.GetErrorCode()
+	output = reader.GetOutput()
+
+	vertices = np.concatenate([electrode.vertices for electrode in scene.electrodes])
+	faces = np.concatenate([scene.electrodes[0].faces, scene.electrodes[1].faces + len(scene.electrodes[0].vertices)])
+	points = vtk_to_numpy(output.GetPoints().GetData())
+
+	assert output.GetNumberOfLines() == 3
+	np.testing.assert_array_equal(points[:len(vertices)], vertices)
+	np.testing.assert_array_equal(vtk_to_numpy(output.GetPolys().GetConnectivityArray()).reshape(-1, 3), faces)
+	np.testing.assert_array_equal(vtk_to_numpy(output.GetPolys().GetOffsetsArray()), np.arange(len(faces) + 1) * 3)
+
+	colors = vtk_to_numpy(output.GetCellData().GetArray('Color'))
+	assert colors.shape == (3 + len(faces), 4)
+	np.testing.assert_array_equal(colors[3], [245, 23, 99, 128])
+
+def test_vtp_header_is_valid_xml(tmp_path):
+	vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+	scene = Scene([Electrode("Plate --{0}--- -", vertices, [[0, 1, 2]], (1, 0, 0))], show_axis=False)
+	file_path = tmp_path / 'names.vtp'
+	export_vtp(scene, str(file_path), False)
+
+	header = file_path.read_bytes().split(b'<AppendedData')[0] + b'</VTKFile>'
+	root = ElementTree.fromstring(header)
+	assert len(root.findall('PolyData/Piece')) == 1
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from Common.Scene import Scene, Electrode, plane_grid
+
+def ribbon(resolution: int = 40, width: float = 0.05) -> Electrode:
+	"""Return the thin electrode, long along x and narrow along y."""
+	vertices, faces = plane_grid(1.0, resolution)
+	vertices[:, 1] *= width
+	return Electrode("Ribbon", vertices, faces, (1, 0, 0))
+
+@pytest.mark.parametrize('max_triangles', [2, 50, 500])
+def test_decimate_fits_budget(max_triangles):
+	electrode = Scene.capacitor(resolution=100).electrodes[1]
+	preview = electrode.decimate(max_triangles)
+
+	assert 0 < preview.triangle_count <= max_triangles
+	assert preview.faces.max() < len(preview.vertices)
+
+def test_decimate_keeps_small_electrode():
+	electrode = Scene.capacitor(resolution=4).electrodes[0]
+	assert electrode.decimate(500) is electrode
+
+def test_decimate_keeps_thin_electrode():
+	electrode = ribbon()
+	preview = electrode.decimate(500)
+
+	assert 0 < preview.triangle_count <= 500
+
+def test_decimate_falls_back_when_every_level_is_empty():
+	electrode = Electrode("Point", np.zeros((3, 3)), np.tile([0, 1, 2], (10, 1)), (1, 0, 0))
+	assert electrode.decimate(5) is electrode
+
+@pytest.mark.parametrize('electrode', [Scene.capacitor(resolution=100).electrodes[1], ribbon()], ids=['square', 'ribbon'])
+def test_decimate_keeps_outline(electrode):
+	preview = electrode.decimate(500)
+
+	np.testing.assert_array_equal(preview.vertices.min(axis=0), electrode.vertices.min(axis=0))
+	np.testing.assert_array_equal(preview.vertices.max(axis=0), electrode.vertices.max(axis=0))
+
+def test_decimate_caches_preview():
+	electrode = Scene.capacitor(resolution=100).electrodes[0]
+	preview = electrode.decimate(500)
+
+	assert electrode.previews == {500: preview}
+	assert electrode.decimate(500) is preview
+	assert electrode.decimate(50) is not preview
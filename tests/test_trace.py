@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import pytest
+from types import SimpleNamespace
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+QtWidgets = pytest.importorskip('PySide6.QtWidgets')
+
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from Common.Trace import TraceRecorder, load_trace, latency_report, TRACE_VERSION
+
+class Window(QtWidgets.QWidget):
+	"""The minimal PlotWindow with the plot widget, axis checkbox and pick listeners."""
+
+	def __init__(self) -> None:
+		super().__init__()
+		self.plot = QtWidgets.QWidget(self)
+		self.plot.resize(200, 100)
+		self.ui = SimpleNamespace(chkAxis=QtWidgets.QCheckBox(self))
+		self.chart = SimpleNamespace(pick_listeners=[])
+
+	def plot_widget(self) -> QtWidgets.QWidget:
+		return self.plot
+
+@pytest.fixture
+def window():
+	app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+	window = Window()
+	yield window
+	window.deleteLater()
+	app.processEvents()
+
+def test_trace_round_trip(tmp_path, window):
+	file_path = str(tmp_path / 'trace.jsonl')
+	recorder = TraceRecorder(window, file_path, {'backend': 'matplotlib', 'resolution': 3})
+
+	window.resize(300, 200)
+	window.show()
+	QtWidgets.QApplication.sendEvent(window.plot, QMouseEvent(
+		QEvent.Type.MouseButtonPress, QPointF(50, 25), window.plot.mapToGlobal(QPointF(50, 25)),
+		Qt.MouseButton.LeftButton, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier))
+	window.ui.chkAxis.click()
+	window.chart.pick_listeners[0]((0.5, 0.25, 0.0))
+
+	trace = load_trace(file_path)
+	recorder.close()
+
+	assert trace['version'] == TRACE_VERSION
+	assert trace['metadata'] == {'backend': 'matplotlib', 'resolution': 3}
+	assert [event['type'] for event in trace['events']] == ['resize', 'press', 'axis', 'pick']
+	assert trace['events'][0]['width'] == 300 and trace['events'][0]['height'] == 200
+	assert trace['events'][1]['x'] == pytest.approx(0.25) and trace['events'][1]['y'] == pytest.approx(0.25)
+	assert trace['events'][2]['checked'] is True
+	assert trace['events'][3]['point'] == [0.5, 0.25, 0.0]
+	assert all(a['time'] <= b['time'] for a, b in zip(trace['events'], trace['events'][1:]))
+
+def test_load_trace_ignores_incomplete_last_line(tmp_path):
+	file_path = tmp_path / 'trace.jsonl'
+	file_path.write_text(json.dumps({'version': TRACE_VERSION, 'metadata': {}}) + '\n{"time": 0.1, "type": "axis", "checked": true}\n{"time": 0.2, "ty', encoding='utf-8')
+
+	assert load_trace(str(file_path))['events'] == [{'time': 0.1, 'type': 'axis', 'checked': True}]
+
+@pytest.mark.parametrize('contents', [
+	json.dumps({'version': TRACE_VERSION + 1, 'metadata': {}}),
+	json.dumps({'version': 1, 'metadata': {}, 'events': []}, indent=1),
+	''])
+def test_load_trace_rejects_wrong_version(tmp_path, contents):
+	file_path = tmp_path / 'trace.jsonl'
+	file_path.write_text(contents, encoding='utf-8')
+
+	with pytest.raises(ValueError, match='Unsupported trace version'):
+		load_trace(str(file_path))
+
+def test_latency_report():
+	report = latency_report({'press': [0.001, 0.002, 0.003], 'move': [], 'axis': [0.010]}).splitlines()
+
+	assert report[0].split() == ['event', 'count', 'p50', 'p90', 'p99', 'max']
+	assert [line.split()[0] for line in report[1:]] == ['press', 'axis', 'all']
+	assert report[1].split() == ['press', '3', '2.00', '2.80', '2.98', '3.00']
+	assert report[2].split() == ['axis', '1', '10.00', '10.00', '10.00', '10.00']
+	assert report[3].split()[:2] == ['all', '4'] and report[3].split()[-1] == '10.00'
+
+def test_latency_report_without_events():
+	assert latency_report({}).splitlines()[1:] == []